@@ -33,15 +33,19 @@ specific to this machine.
 # Imports                                                                     #
 ###############################################################################
 
+import bisect
 import os
-import argparse
-import json
+import pickle
 import sys
-import subprocess
 
 from os import path
 from typing import Mapping, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ###############################################################################
 # Constants                                                                   #
 ###############################################################################
@@ -53,28 +57,46 @@ CONFIG_FILEPATH = path.join(LOCAL_GOTO_DIR, "config.json")
 GLOBAL_ROOTS_DIR = path.join(GLOBAL_GOTO_DIR, "roots")
 LOCAL_ROOTS_DIR = path.join(LOCAL_GOTO_DIR, "roots")
 
+# Precomputed prefixes so building a root's json filepath is a single
+# string concat rather than a path.join call.
+GLOBAL_ROOTS_PREFIX = GLOBAL_ROOTS_DIR + os.sep
+LOCAL_ROOTS_PREFIX = LOCAL_ROOTS_DIR + os.sep
+
+CACHE_DIR = path.expanduser("~/.cache/goto")
+CACHE_FILEPATH = path.join(CACHE_DIR, "state.pkl")
+
 
 ###############################################################################
 # Classes                                                                     #
 ###############################################################################
 
 
-class ArgumentParserError(Exception):
-    pass
+class Args(object):
+    """Parsed command line options; mirrors the old argparse namespace."""
 
+    def __init__(self):
+        self.set = None
+        self.print_arg = False
+        self.open = None
+        self.all = False
+        self.roots = False
+        self.configs = False
+        self.new = None
+        self.setup = False
+        self.complete = None
+        self.use_global = False
+        self.temp_file = None
+        self.help = False
+        self.first = "all"
+        self.second = None
 
-class GenerousArgumentParser(argparse.ArgumentParser):
-    def error(self, message):
-        raise ArgumentParserError(message)
 
-    def parse_args(self, args=None, namespace=None):
-        try:
-            return super(GenerousArgumentParser, self).parse_args(args)
-        except ArgumentParserError:
-            return super(GenerousArgumentParser, self).parse_args([])
+class Root(object):
 
+    __slots__ = ("root", "path", "defaults", "shortcuts", "config_filepath")
 
-class Root(object):
+    # Keys tolerated in root JSON files but not stored on the object
+    EXTRA_KEYS = ("name", "abbreviation")
 
     def __init__(
         self,
@@ -82,7 +104,6 @@ class Root(object):
         path: str,
         defaults: List[str],
         shortcuts: Mapping[str, str],
-        **extra  # Ignore any extraneous keywords
     ):
         self.root = root
         self.path = path
@@ -94,7 +115,7 @@ class Root(object):
         root_obj = cls(
             root=root,
             path="",
-            default=[],
+            defaults=[],
             shortcuts=dict()
         )
         root_obj.config_filepath = config_filepath
@@ -104,30 +125,64 @@ class Root(object):
         return self.__str__()
 
     def __str__(self) -> str:
-        return f"{self.__dict__.__str__()}"
+        return (f"Root(root={self.root!r}, path={self.path!r}, "
+                f"defaults={self.defaults!r}, shortcuts={self.shortcuts!r})")
+
+    def to_dict(self) -> Mapping[str, Any]:
+        return {
+            "root": self.root,
+            "path": self.path,
+            "defaults": self.defaults,
+            "shortcuts": self.shortcuts,
+        }
 
     def json(self) -> str:
-        return json.dumps(self.shortcuts, **json_args(True))
+        return to_json(self.shortcuts, use_dict=True)
 
     @staticmethod
     def read(filepath) -> "Root":
         try:
-            with open(filepath) as f:
-                root = Root(**json.load(f))
-                root.config_filepath = filepath
-                return root
-        except Exception:
+            data = read_bytes(filepath)
+            if not data:
+                return None
+            fields = from_json(data)
+            for key in Root.EXTRA_KEYS:
+                fields.pop(key, None)
+            root = Root(**fields)
+            root.config_filepath = filepath
+            return root
+        except (OSError, ValueError, TypeError):
+            # Stay quiet: completion re-reads unloadable files on every
+            # TAB press, and -s/-p report bad roots on their own terms.
             return None
 
     def write(self) -> None:
-        with open(self.config_filepath, 'w') as f:
-            json.dump(self, f, **json_args(True))
+        data = to_json(self, use_dict=True)
+
+        # Skip the rewrite (and the cache invalidation its new mtime would
+        # cause) when the file already holds this exact content.
+        try:
+            if read_bytes(self.config_filepath).decode() == data:
+                return
+        except OSError:
+            pass
+
+        write_atomic(self.config_filepath, data)
 
 
 class Roots(object):
 
-    def __init__(self, roots: Mapping[str, Root]):
+    __slots__ = (
+        "_roots", "_filepaths", "_fingerprint", "_fresh", "_merged", "_paths"
+    )
+
+    def __init__(self, roots: Mapping[str, Root], filepaths: Mapping[str, str] = None):
         self._roots = roots
+        self._filepaths = filepaths if filepaths is not None else {}
+        self._fingerprint = None
+        self._fresh = False
+        self._merged = {}
+        self._paths = {}
 
     def __str__(self) -> str:
         return self._roots.__str__()
@@ -136,13 +191,22 @@ class Roots(object):
         return self.__str__()
 
     def __getitem__(self, root):
-        return self._roots.get(root, None)
+        root_obj = self._roots.get(root, None)
+        if root_obj is None and root in self._filepaths:
+            root_obj = Root.read(self._filepaths[root])
+            if root_obj is not None:
+                self._roots[root] = root_obj
+            else:
+                del self._filepaths[root]
+        return root_obj
 
     def __contains__(self, item):
-        return self[item] is not None
+        # Membership is a name check; don't parse a root file just to
+        # answer it.
+        return item in self._roots or item in self._filepaths
 
     def roots(self) -> List[str]:
-        return list(self._roots.keys())
+        return list({**self._roots, **self._filepaths})
 
     def keys(self) -> List[str]:
         return self.roots()
@@ -165,38 +229,103 @@ class Roots(object):
             return jsoner()
 
     def all_json(self, root) -> str:
-        return json.dumps(self.all_shortcuts(root), **json_args(True))
+        return to_json(self.all_shortcuts(root), use_dict=True)
 
     def all_shortcuts(self, root) -> Mapping[str, str]:
+        cuts, _ = self._merge_shortcuts(root, set())
+        return cuts
+
+    def _merge_shortcuts(self, root, seen):
+        """Merge a root's defaults chain; also report whether a cycle
+        was hit, since merges truncated by the cycle guard must not be
+        memoized (or persisted) as if they were complete."""
+        cached = self._merged.get(root)
+        if cached is not None:
+            return cached, False
+
         root_obj = self[root]
         if root_obj is None:
-            return {}
+            return {}, False
+
+        # Guard against cycles in defaults chains, which used to recurse
+        # until RecursionError. seen tracks the current chain only, so
+        # diamonds in the defaults graph still merge fully.
+        if root in seen:
+            return {}, True
 
-        cuts = root_obj.shortcuts
+        seen.add(root)
+        cyclic = False
+        cuts = dict(root_obj.shortcuts)
         for default in root_obj.defaults:
-            cuts.update(self.all_shortcuts(default))
-        return cuts
+            merged, hit = self._merge_shortcuts(default, seen)
+            cuts.update(merged)
+            cyclic = cyclic or hit
+        seen.discard(root)
+
+        if not cyclic:
+            self._merged[root] = cuts
+        return cuts, cyclic
+
+    def full_paths(self, root) -> Mapping[str, str]:
+        cached = self._paths.get(root)
+        if cached is not None:
+            return cached
+
+        base = self.path(root)
+        if base is None:
+            return {}
+
+        table = {
+            cut: path.join(base, relative)
+            for cut, relative in self.all_shortcuts(root).items()
+        }
+        self._paths[root] = table
+        return table
 
     def root_filepath(self, root):
         return self.get(root, "config_filepath")
 
     @staticmethod
-    def read(*dirpaths: str) -> "Roots":
-        files = []
+    def scan(*dirpaths: str) -> "Roots":
+        filepaths = {}
+        stats = []
         for dirpath in dirpaths:
-            files += [
-                path.join(dirpath, f)
-                for f in os.listdir(dirpath)
-                if path.isfile(path.join(dirpath, f))
-            ]
-
-        roots = {
-            root.root: root for root in
-            (Root.read(f) for f in files)
-            if root is not None and root.root is not None
-        }
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        name = entry.name
+                        if name.endswith(".json"):
+                            name = name[:-len(".json")]
+                        filepaths[name] = entry.path
+                        stat = entry.stat()
+                        stats.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+        roots = Roots({}, filepaths)
+        roots._fingerprint = tuple(sorted(stats))
+        return roots
 
-        return Roots(roots)
+    @staticmethod
+    def read_cached(*dirpaths: str) -> "Roots":
+        roots = Roots.scan(*dirpaths)
+
+        cached = read_cache().get("roots")
+        if cached is not None and len(cached) == 3 and cached[0] == roots._fingerprint:
+            roots._roots.update(cached[1])
+            roots._merged.update(cached[2])
+            roots._fresh = True
+
+        return roots
+
+    def load_all(self) -> None:
+        for name in list(self._filepaths):
+            self[name]
+        if not self._fresh:
+            # cache the merged defaults chains too, so warm runs skip the
+            # merge as well as the parse
+            for name in list(self._roots):
+                self.all_shortcuts(name)
+            update_cache(roots=(self._fingerprint, self._roots, self._merged))
+            self._fresh = True
 
     def write(self) -> None:
         for _, root_obj in self._roots.items():
@@ -207,18 +336,104 @@ class Roots(object):
 # Helper functions                                                            #
 ###############################################################################
 
-def json_args(use_dict: bool):
-    return {
-        "default": lambda o: o.__dict__ if use_dict else o,
+# Keyword arguments for the stdlib json fallback, built once instead of
+# per call; keyed by use_dict.
+JSON_ARGS = {
+    True: {
+        "default": lambda o: o.to_dict(),
+        "sort_keys": True,
+        "indent": "\t"
+    },
+    False: {
         "sort_keys": True,
         "indent": "\t"
-    }
+    },
+}
+
+
+def to_json(obj, use_dict: bool) -> str:
+    if orjson is not None:
+        default = (lambda o: o.to_dict()) if use_dict else None
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    import json
+    return json.dumps(obj, **JSON_ARGS[use_dict])
+
+
+def from_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+
+    import json
+    return json.loads(data)
+
+
+BOOL_OPTIONS = {
+    "-p": "print_arg", "--print": "print_arg",
+    "-a": "all", "--all": "all",
+    "-r": "roots", "--roots": "roots",
+    "-c": "configs", "--configs": "configs", "--config": "configs",
+    "-g": "use_global", "--use-global": "use_global",
+    "--setup": "setup",
+    "-h": "help", "--help": "help",
+}
+
+VALUE_OPTIONS = {
+    "-s": "set", "--set": "set",
+    "-o": "open", "--open": "open",
+    "-n": "new", "--new": "new",
+    "-t": "temp_file", "--temp-file": "temp_file",
+    "--complete": "complete",
+}
+
+
+def parse_argv(argv, strict: bool = True) -> Args:
+
+    # strict is what main() wants: a value option with no value is a
+    # usage error. Completion parses half-typed command lines, so it
+    # passes strict=False and takes the empty value instead.
+
+    args = Args()
+    positionals = []
+
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        option, equals, inline_value = arg.partition("=")
+
+        if option in BOOL_OPTIONS:
+            setattr(args, BOOL_OPTIONS[option], True)
+        elif option in VALUE_OPTIONS:
+            if not equals:
+                index += 1
+                inline_value = argv[index] if index < len(argv) else ""
+            if strict and not inline_value:
+                print(f"goto: option {option} requires a value "
+                      "(see goto --help)", file=sys.stderr)
+                sys.exit(2)
+            setattr(args, VALUE_OPTIONS[option], inline_value)
+        else:
+            positionals.append(arg)
+
+        index += 1
+
+    if positionals:
+        args.first = positionals[0]
+    if len(positionals) > 1:
+        args.second = positionals[1]
 
+    return args
 
-def get_parser(parser_type):
 
-    parser = parser_type(description=__doc__,
-                         formatter_class=argparse.RawDescriptionHelpFormatter)
+def get_parser():
+
+    # argparse is only needed to render --help; keep it off the hot path
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
 
     group = parser.add_mutually_exclusive_group()
 
@@ -287,7 +502,9 @@ def set_current_root(new_root, roots, configs):
 
     current_root = roots.name(configs["current_root"])
 
-    if new_root in roots:
+    # A name check is not enough here: -s must reject roots whose file
+    # exists but does not load, or every later goto hits a missing root.
+    if roots[new_root] is not None:
         configs["current_root"] = new_root
         save_configs(configs)
         return f"New root set to {new_root}"
@@ -295,14 +512,80 @@ def set_current_root(new_root, roots, configs):
         return f"{new_root} not recognized, current root is stil {current_root}"
 
 
+def write_atomic(filepath, data: str) -> None:
+    tmp_filepath = filepath + ".tmp"
+    with open(tmp_filepath, 'w') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filepath, filepath)
+
+
 def save_configs(configs):
-    with open(CONFIG_FILEPATH, 'w') as config_file:
-        json.dump(configs, config_file, **json_args(False))
+    write_atomic(CONFIG_FILEPATH, to_json(configs, use_dict=False))
+
+
+def read_bytes(filepath) -> bytes:
+    # os.open/os.read skips the buffered file-object machinery; these
+    # files are small, so one read usually drains them.
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
 
 
 def load_file(filepath):
-    with open(filepath) as the_file:
-        return json.load(the_file)
+    return from_json(read_bytes(filepath))
+
+
+def file_key(filepath):
+    stat = os.stat(filepath)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# The unpickled contents of CACHE_FILEPATH, loaded at most once per
+# process; the configs and roots sections both read from it and
+# update_cache mutates it in place before rewriting the file.
+_cache = None
+
+
+def read_cache():
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILEPATH, 'rb') as cache_file:
+                _cache = pickle.load(cache_file)
+        except (OSError, EOFError, pickle.PickleError, AttributeError):
+            _cache = {}
+    return _cache
+
+
+def update_cache(**sections):
+    cache = read_cache()
+    cache.update(sections)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_filepath = CACHE_FILEPATH + ".tmp"
+    with open(tmp_filepath, 'wb') as cache_file:
+        pickle.dump(cache, cache_file, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_filepath, CACHE_FILEPATH)
+
+
+def load_configs():
+    key = file_key(CONFIG_FILEPATH)
+    cached = read_cache().get("configs")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    configs = load_file(CONFIG_FILEPATH)
+    update_cache(configs=(key, configs))
+    return configs
 
 
 def print_path(path, temp_file):
@@ -318,10 +601,10 @@ def print_information(print_arg, roots, configs):
         root_obj = roots[configs['current_root']]
         return root_obj.json()
     elif print_arg == "configs":
-        return json.dumps(configs, **json_args(False))
+        return to_json(configs, use_dict=False)
     elif print_arg == "roots":
-        return json.dumps(roots.keys(), **json_args(False))
-    elif print_arg in roots:
+        return to_json(roots.keys(), use_dict=False)
+    elif roots[print_arg] is not None:
         return roots.json(print_arg)
     else:
         return "Invalid print arg: {}".format(print_arg)
@@ -332,47 +615,31 @@ def all_print_information(print_arg, roots, configs):
     if print_arg == "all":
         return roots.all_json(configs["current_root"])
     elif print_arg == "roots":
-        return json.dumps(roots.keys(), **json_args(False))
-    elif print_arg in roots:
+        return to_json(roots.keys(), use_dict=False)
+    elif roots[print_arg] is not None:
         return roots.all_json(print_arg)
     else:
         return f"Invalid print arg: {print_arg}"
 
 
 def get_path(shortcut, roots, root):
-
-    shortcuts = roots.all_shortcuts(root)
-    relative_path = shortcuts.get(shortcut, None)
-
-    if relative_path is None:
-        return None
-
-    full_path = path.join(roots.path(root), relative_path)
-    return full_path
+    return roots.full_paths(root).get(shortcut, None)
 
 
 def edit_file(filepath):
+    # goto exits as soon as the editor closes anyway, so hand the process
+    # over to the editor instead of forking a child and waiting on it.
     editor = os.getenv('VISUAL')
-    return subprocess.call([editor, filepath])
-
-
-def ensure_dir(directory):
-    os.makedirs(directory, exist_ok=True)
-
-
-def ensure_file(path):
-    open(path, 'w').close()
+    os.execvp(editor, [editor, filepath])
 
 
 def write_config_files():
 
-    # ensure all directories and files are present
-    ensure_dir(LOCAL_GOTO_DIR)
-    ensure_dir(LOCAL_ROOTS_DIR)
-
-    ensure_file(CONFIG_FILEPATH)
+    # LOCAL_ROOTS_DIR sits under LOCAL_GOTO_DIR, so one makedirs creates
+    # both, and save_configs creates the config file itself — no need to
+    # touch an empty one first.
+    os.makedirs(LOCAL_ROOTS_DIR, exist_ok=True)
 
-    # write configs
     configs = {"current_root": "goto"}
     save_configs(configs)
 
@@ -380,7 +647,7 @@ def write_config_files():
 def find_applicable_complete_options(args, roots, configs):
 
     cmd = args.complete.split(' ')
-    complete_args = get_parser(GenerousArgumentParser).parse_args(cmd)
+    complete_args = parse_argv(cmd, strict=False)
 
     options = {}
     word_to_complete = ""
@@ -412,21 +679,127 @@ def find_applicable_complete_options(args, roots, configs):
 
 
 def filter_applicable_shortcuts(shortcuts, word_to_complete):
-    return [shortcut for shortcut in shortcuts if shortcut.startswith(word_to_complete)]
+    ordered = sorted(shortcuts)
+    if not word_to_complete:
+        return ordered
+
+    # All completions of a prefix form a contiguous run in sorted order;
+    # find its bounds with two bisections instead of scanning every key.
+    lo = bisect.bisect_left(ordered, word_to_complete)
+    last = ord(word_to_complete[-1])
+    if last >= 0x10FFFF:
+        return [cut for cut in ordered[lo:] if cut.startswith(word_to_complete)]
+    hi = bisect.bisect_left(ordered, word_to_complete[:-1] + chr(last + 1), lo)
+    return ordered[lo:hi]
 
 
 ###############################################################################
 # Main script                                                                 #
 ###############################################################################
 
+def set_mode(args, roots, configs):
+    result_msg = set_current_root(args.set, roots, configs)
+    print(result_msg)
+
+
+def print_mode(args, roots, configs):
+    information = print_information(args.first, roots, configs)
+    print(information)
+
+
+def open_mode(args, roots, configs):
+    root_filepath = roots.root_filepath(args.open)
+    if path.isfile(root_filepath):
+        print("Opening file " + root_filepath)
+        edit_file(root_filepath)
+    else:
+        print("Error opening file: " + root_filepath)
+
+
+def configs_mode(args, roots, configs):
+    print("Editing configs")
+    edit_file(CONFIG_FILEPATH)
+
+
+def all_mode(args, roots, configs):
+    all_shortcuts = all_print_information(args.first, roots, configs)
+    print(all_shortcuts)
+
+
+def roots_mode(args, roots, configs):
+    for root in roots.roots():
+        if root == configs["current_root"]:
+            print(f"*{root}")
+        else:
+            print(root)
+
+
+def new_mode(args, roots, configs):
+    root = args.new
+
+    roots_prefix = GLOBAL_ROOTS_PREFIX if args.use_global else LOCAL_ROOTS_PREFIX
+    new_root_filepath = f"{roots_prefix}{root}.json"
+
+    if not path.isfile(new_root_filepath):
+        Root.empty(root, new_root_filepath).write()
+        print("Writing new root {}".format(root))
+        edit_file(new_root_filepath)
+    else:
+        print("ERROR! root {} already exists!".format(root))
+
+
+def complete_mode(args, roots, configs):
+    roots.load_all()
+    applicable_options = find_applicable_complete_options(args, roots, configs)
+    print(applicable_options)
+
+
+def goto_mode(args, roots, configs):
+
+    # combine cmdlines args + configs to get path params
+    root, shortcut = parameters_from_args(args, configs)
+
+    # expand shortcut into full length path
+    full_path = get_path(shortcut, roots, root)
+
+    # name of path to change to; print this so bash can cd to it
+    if full_path:
+        print_path(full_path, args.temp_file)
+
+    # if shortcut not resolved, print error and exit
+    else:
+        root_obj = roots[root]
+        print(f"Shortcut missing in {root_obj.root if root_obj else root}")
+        return 1
+
+
+# Checked in order; the first Args field that is truthy wins, which keeps
+# the old elif-chain precedence.
+MODES = (
+    ("set", set_mode),
+    ("print_arg", print_mode),
+    ("open", open_mode),
+    ("configs", configs_mode),
+    ("all", all_mode),
+    ("roots", roots_mode),
+    ("new", new_mode),
+    ("complete", complete_mode),
+    ("first", goto_mode),
+)
+
+
 def main():
 
     #
     # Parse command line arguments
     # # # # # # # # # # # # # # # # #
 
-    parser = get_parser(argparse.ArgumentParser)
-    args = parser.parse_args()
+    args = parse_argv(sys.argv[1:])
+
+    # check help mode
+    if args.help:
+        get_parser().print_help()
+        sys.exit(0)
 
     # check setup mode
     if args.setup:
@@ -442,8 +815,8 @@ def main():
     # Load configs
     # # # # # # # # # # # #
 
-    configs = load_file(CONFIG_FILEPATH)
-    roots = Roots.read(GLOBAL_ROOTS_DIR, LOCAL_ROOTS_DIR)
+    configs = load_configs()
+    roots = Roots.read_cached(GLOBAL_ROOTS_DIR, LOCAL_ROOTS_DIR)
 
     #
     # Set op mode
@@ -451,83 +824,14 @@ def main():
 
     exit_code = 0
 
-    # set current root mode
-    if args.set:
-        result_msg = set_current_root(args.set, roots, configs)
-        print(result_msg)
-
-    # print mode
-    elif args.print_arg:
-        information = print_information(args.first, roots, configs)
-        print(information)
-
-    # open mode
-    elif args.open:
-        root_filepath = roots.root_filepath(args.open)
-        if path.isfile(root_filepath):
-            edit_file(root_filepath)
-            print("Opening file " + root_filepath)
-        else:
-            print("Error opening file: " + root_filepath)
-
-    # edit configs mode
-    elif args.configs:
-        print("Editing configs")
-        edit_file(CONFIG_FILEPATH)
-
-    # print all mode
-    elif args.all:
-        all_shortcuts = all_print_information(args.first, roots, configs)
-        print(all_shortcuts)
-
-    # print roots mode
-    elif args.roots:
-        for root in roots.roots():
-            if root == configs["current_root"]:
-                print(f"*{root}")
-            else:
-                print(root)
-
-    # create new root mode
-    elif args.new:
-        root = args.new[0]
-
-        root_dir = GLOBAL_ROOTS_DIR if args.use_global else LOCAL_ROOTS_DIR
-        new_root_filepath = path.join(root_dir, f"{root}.json")
-
-        if not path.isfile(new_root_filepath):
-            Root.empty(root, new_root_filepath).write()
-            edit_file(new_root_filepath)
-            print("Writing new root {}".format(root))
-        else:
-            print("ERROR! root {} already exists!".format(root))
-
-    # complete mode
-    elif args.complete:
-        applicable_options = find_applicable_complete_options(args, roots, configs)
-        print(applicable_options)
-
-    # goto shortcut mode
-    elif args.first:
-
-        # combine cmdlines args + configs to get path params
-        root, shortcut = parameters_from_args(args, configs)
-
-        # expand shortcut into full length path
-        full_path = get_path(shortcut, roots, root)
-
-        # name of path to change to; print this so bash can cd to it
-        if full_path:
-            print_path(full_path, args.temp_file)
-
-        # if shortcut not resolved, print error and exit
-        else:
-            print(f"Shortcut missing in {roots[root].root}")
-            exit_code = 1
+    for flag, mode in MODES:
+        if getattr(args, flag):
+            exit_code = mode(args, roots, configs) or 0
+            break
 
     # no mode selected, print help
     else:
-        parser.print_help()
+        get_parser().print_help()
 
     sys.exit(exit_code)
 